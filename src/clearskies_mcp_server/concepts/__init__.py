@@ -5,6 +5,8 @@ This package contains detailed explanations of clearskies framework concepts
 used by the explain_concept tool. Concepts are organized by category.
 """
 
+from types import MappingProxyType
+
 from .advanced import ADVANCED_CONCEPTS
 from .authentication import AUTH_CONCEPTS
 from .backends import BACKEND_CONCEPTS
@@ -20,22 +22,28 @@ from .observability import OBSERVABILITY_CONCEPTS
 from .programming import PROGRAMMING_CONCEPTS
 from .reference import REFERENCE_CONCEPTS
 
-# Combine all concept dictionaries into one
-CONCEPT_EXPLANATIONS = {
-    **CORE_CONCEPTS,
-    **DI_CONCEPTS,
-    **AUTH_CONCEPTS,
-    **LIFECYCLE_CONCEPTS,
-    **PROGRAMMING_CONCEPTS,
-    **DATA_CONCEPTS,
-    **FEATURES_CONCEPTS,
-    **OBSERVABILITY_CONCEPTS,
-    **ADVANCED_CONCEPTS,
-    **BACKEND_CONCEPTS,
-    **INTERNALS_CONCEPTS,
-    **DEVEX_CONCEPTS,
-    **REFERENCE_CONCEPTS,
-    **BASE_CLASS_CONCEPTS,
-}
+# Combine all concept dictionaries into one flat, read-only mapping so a lookup
+# is a single probe regardless of how many categories exist.
+CONCEPT_EXPLANATIONS = MappingProxyType(
+    {
+        **CORE_CONCEPTS,
+        **DI_CONCEPTS,
+        **AUTH_CONCEPTS,
+        **LIFECYCLE_CONCEPTS,
+        **PROGRAMMING_CONCEPTS,
+        **DATA_CONCEPTS,
+        **FEATURES_CONCEPTS,
+        **OBSERVABILITY_CONCEPTS,
+        **ADVANCED_CONCEPTS,
+        **BACKEND_CONCEPTS,
+        **INTERNALS_CONCEPTS,
+        **DEVEX_CONCEPTS,
+        **REFERENCE_CONCEPTS,
+        **BASE_CLASS_CONCEPTS,
+    }
+)
+
+# Sorted concept names, computed once for listings and "unknown concept" messages.
+CONCEPT_NAMES = tuple(sorted(CONCEPT_EXPLANATIONS))
 
-__all__ = ["CONCEPT_EXPLANATIONS"]
+__all__ = ["CONCEPT_EXPLANATIONS", "CONCEPT_NAMES"]
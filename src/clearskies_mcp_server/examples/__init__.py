@@ -5,23 +5,49 @@ This module contains complete, runnable examples demonstrating various
 clearskies features and patterns.
 """
 
-from .advanced_queries import example_advanced_queries
-from .api_backend import example_api_backend
-from .audit_trail import example_audit_trail
-from .authentication import example_authentication
-from .authorization import example_authorization
-from .cli_app import example_cli_app
-from .configuration import example_configuration
-from .endpoint_group import example_endpoint_group
-from .error_handling import example_error_handling
-from .hierarchical_data import example_hierarchical_data
-from .migrations import example_migrations
-from .pivot_data import example_pivot_data
-from .relationships import example_relationships
-from .restful_api import example_restful_api
-from .secrets_backend import example_secrets_backend
-from .state_machine_advanced import example_state_machine_advanced
-from .testing import example_testing
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .advanced_queries import example_advanced_queries
+    from .api_backend import example_api_backend
+    from .audit_trail import example_audit_trail
+    from .authentication import example_authentication
+    from .authorization import example_authorization
+    from .cli_app import example_cli_app
+    from .configuration import example_configuration
+    from .endpoint_group import example_endpoint_group
+    from .error_handling import example_error_handling
+    from .hierarchical_data import example_hierarchical_data
+    from .migrations import example_migrations
+    from .pivot_data import example_pivot_data
+    from .relationships import example_relationships
+    from .restful_api import example_restful_api
+    from .secrets_backend import example_secrets_backend
+    from .state_machine_advanced import example_state_machine_advanced
+    from .testing import example_testing
+
+# Submodule that defines each example function. Submodules are imported on
+# first attribute access so importing the package does not load every example.
+_EXAMPLE_MODULES = {
+    "example_restful_api": "restful_api",
+    "example_relationships": "relationships",
+    "example_authentication": "authentication",
+    "example_cli_app": "cli_app",
+    "example_api_backend": "api_backend",
+    "example_testing": "testing",
+    "example_authorization": "authorization",
+    "example_error_handling": "error_handling",
+    "example_endpoint_group": "endpoint_group",
+    "example_migrations": "migrations",
+    "example_hierarchical_data": "hierarchical_data",
+    "example_audit_trail": "audit_trail",
+    "example_pivot_data": "pivot_data",
+    "example_advanced_queries": "advanced_queries",
+    "example_configuration": "configuration",
+    "example_state_machine_advanced": "state_machine_advanced",
+    "example_secrets_backend": "secrets_backend",
+}
 
 __all__ = [
     "example_restful_api",
@@ -42,3 +68,19 @@ __all__ = [
     "example_state_machine_advanced",
     "example_secrets_backend",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import and cache the example function ``name`` on first access."""
+    try:
+        module_name = _EXAMPLE_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    function = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = function
+    return function
+
+
+def __dir__() -> list[str]:
+    """List the lazily loaded example functions alongside the module globals."""
+    return sorted({*globals(), *__all__})
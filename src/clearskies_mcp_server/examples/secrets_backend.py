@@ -20,6 +20,9 @@ sensitive configuration data like API keys, database credentials, and service to
 import clearskies
 from clearskies import columns
 from datetime import datetime
+import hmac
+import threading
+import time
 
 # =============================================================================
 # API CREDENTIALS MODEL
@@ -51,6 +54,7 @@ class ApiCredential(clearskies.Model):
         if new_api_secret:
             data["api_secret"] = new_api_secret
         self.save(data)
+        CredentialManager.invalidate()
 
 
 # =============================================================================
@@ -77,21 +81,32 @@ class DatabaseCredential(clearskies.Model):
     created_at = columns.Created()
     updated_at = columns.Updated()
 
+    # Connection string template and SSL query string, per database engine
+    connection_templates = {
+        "mysql": "mysql://{username}:{password}@{host}:{port}/{database}{ssl}",
+        "postgresql": "postgresql://{username}:{password}@{host}:{port}/{database}{ssl}",
+        "mongodb": "mongodb://{username}:{password}@{host}:{port}/{database}{ssl}",
+        "redis": "redis://:{password}@{host}:{port}",
+    }
+    ssl_parameters = {
+        "mysql": "?ssl=true",
+        "postgresql": "?sslmode=require",
+        "mongodb": "?ssl=true",
+    }
+
     def get_connection_string(self) -> str:
         """Generate a connection string for this database."""
-        if self.engine == "mysql":
-            ssl = "?ssl=true" if self.ssl_enabled else ""
-            return f"mysql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}{ssl}"
-        elif self.engine == "postgresql":
-            ssl = "?sslmode=require" if self.ssl_enabled else ""
-            return f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}{ssl}"
-        elif self.engine == "mongodb":
-            ssl = "?ssl=true" if self.ssl_enabled else ""
-            return f"mongodb://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}{ssl}"
-        elif self.engine == "redis":
-            return f"redis://:{self.password}@{self.host}:{self.port}"
-        else:
+        template = self.connection_templates.get(self.engine)
+        if template is None:
             raise ValueError(f"Unsupported engine: {self.engine}")
+        return template.format(
+            username=self.username,
+            password=self.password,
+            host=self.host,
+            port=self.port,
+            database=self.database,
+            ssl=self.ssl_parameters.get(self.engine, "") if self.ssl_enabled else "",
+        )
 
     def get_connection_dict(self) -> dict:
         """Get connection parameters as a dictionary."""
@@ -139,14 +154,31 @@ class ServiceToken(clearskies.Model):
             "rotated_at": datetime.utcnow(),
             "rotation_count": self.rotation_count + 1,
         })
+        CredentialManager.invalidate()
 
     def validate_token(self, token: str) -> bool:
-        """Check if a token is valid (current or previous)."""
-        return token in [self.current_token, self.previous_token]
+        """
+        Check if a token is valid (current or previous).
+
+        Uses hmac.compare_digest, and always checks both tokens, so the time
+        taken doesn't reveal how much of a guess was right.
+        """
+        return token_matches(token, (self.current_token, self.previous_token))
 
     def invalidate_previous(self):
         """Invalidate the previous token after rotation grace period."""
         self.save({"previous_token": None})
+        CredentialManager.invalidate()
+
+
+def token_matches(token: str, known_tokens: tuple) -> bool:
+    """Compare token against every non-empty known token in constant time."""
+    candidate = token.encode()
+    valid = False
+    for known in known_tokens:
+        if known:
+            valid |= hmac.compare_digest(candidate, known.encode())
+    return valid
 
 
 # =============================================================================
@@ -203,33 +235,79 @@ class AkeylessCredential(clearskies.Model):
 # =============================================================================
 
 class CredentialManager:
-    """Service for managing credentials across the application."""
+    """
+    Service for managing credentials across the application.
+
+    Lookups are cached in memory for `cache_ttl` seconds so hot paths don't go
+    to the secrets manager (and pay for decryption) on every request. The cache
+    lives on the class, so it is shared by every CredentialManager, including
+    ones created per request. Only plain values are cached, never models, and
+    misses are not cached, so unknown names can't fill it up. The rotation
+    methods on the models call `invalidate()`, but that only clears this
+    process's cache: other workers keep serving the old value (and rejecting
+    a newly rotated token) for up to `cache_ttl` seconds.
+    """
+    cache_ttl = 300  # seconds
+    cache_maxsize = 1024
+    _cache = {}
+    _cache_lock = threading.Lock()
 
     def __init__(self):
         self.api_credentials = ApiCredential()
         self.db_credentials = DatabaseCredential()
         self.service_tokens = ServiceToken()
 
+    def _cached(self, key: tuple, load):
+        """Return the cached value for key, calling load() if it is missing or expired."""
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+        value = load()
+        if value is None:
+            return None
+        with self._cache_lock:
+            if key not in self._cache and len(self._cache) >= self.cache_maxsize:
+                # Evict the oldest entry; dicts keep insertion order
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = (now + self.cache_ttl, value)
+        return value
+
+    @classmethod
+    def invalidate(cls):
+        """Forget all cached credentials, e.g. after a rotation."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
     def get_api_key(self, provider: str, environment: str) -> str:
         """Get API key for a provider and environment."""
-        cred = self.api_credentials.find(f"provider={provider}").find(f"environment={environment}")
-        if not cred.exists:
-            raise ValueError(f"No API credential found for {provider}/{environment}")
-        return cred.api_key
+        def load():
+            cred = self.api_credentials.where(f"provider={provider}").where(f"environment={environment}").first()
+            if not cred.exists:
+                raise ValueError(f"No API credential found for {provider}/{environment}")
+            return cred.api_key
+        return self._cached(("api_key", provider, environment), load)
 
     def get_database_connection(self, name: str) -> str:
         """Get database connection string by name."""
-        cred = self.db_credentials.find(f"name={name}")
-        if not cred.exists:
-            raise ValueError(f"No database credential found for {name}")
-        return cred.get_connection_string()
+        def load():
+            cred = self.db_credentials.find(f"name={name}")
+            if not cred.exists:
+                raise ValueError(f"No database credential found for {name}")
+            return cred.get_connection_string()
+        return self._cached(("database", name), load)
 
     def validate_service_token(self, service: str, token: str) -> bool:
         """Validate a service token."""
-        svc_token = self.service_tokens.find(f"service_name={service}")
-        if not svc_token.exists:
+        def load():
+            svc_token = self.service_tokens.find(f"service_name={service}")
+            if not svc_token.exists:
+                return None
+            return (svc_token.current_token, svc_token.previous_token)
+        known_tokens = self._cached(("service_token", service), load)
+        if known_tokens is None:
             return False
-        return svc_token.validate_token(token)
+        return token_matches(token, known_tokens)
 
 
 # =============================================================================
@@ -299,4 +377,5 @@ if __name__ == "__main__":
 6. **Limit permissions** - Use IAM policies to restrict who can read secrets
 7. **Don't log secrets** - Never log credential values
 8. **Validate on startup** - Check that required credentials exist at app startup
+9. **Cache lookups briefly** - Avoid a secrets manager round trip per request, and invalidate after rotation
 '''
@@ -20,7 +20,11 @@ state transition validation, state history tracking, and multiple independent st
 import clearskies
 from clearskies import columns
 from datetime import datetime
+import atexit
 import json
+import os
+import queue
+import threading
 
 # =============================================================================
 # STATE TRANSITION DEFINITIONS
@@ -51,15 +55,82 @@ PAYMENT_TRANSITIONS = {
     "failed": ["pending"],  # Can retry
 }
 
+# Freeze the allowed targets so each transition check is a set lookup
+ORDER_TRANSITIONS = {state: frozenset(targets) for state, targets in ORDER_TRANSITIONS.items()}
+PAYMENT_TRANSITIONS = {state: frozenset(targets) for state, targets in PAYMENT_TRANSITIONS.items()}
+
+# Timestamp column to set when an order enters each status
+ORDER_STATUS_TIMESTAMPS = {
+    "confirmed": "confirmed_at",
+    "processing": "processing_started_at",
+    "shipped": "shipped_at",
+    "delivered": "delivered_at",
+    "cancelled": "cancelled_at",
+}
+
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+# Notifications are queued instead of sent inline so save() never waits on
+# email or webhook delivery. A background worker, started by the first
+# send_notification() call in each process (so it also runs under a forking
+# server), drains the queue and delivers notifications in batches. At exit the
+# worker is told to stop and given a few seconds to deliver what is left.
+notification_queue = queue.SimpleQueue()
+NOTIFICATION_BATCH_SIZE = 32
+NOTIFICATION_BATCH_WAIT = 0.05  # seconds
+_STOP_WORKER = object()
+_notification_worker_pid = None
+_notification_worker_lock = threading.Lock()
+
+
 def send_notification(order_id: str, event: str, data: dict = None):
-    """Send notification for order events."""
-    print(f"Notification: Order {order_id} - {event}")
-    # In production: send email, push notification, webhook, etc.
+    """Queue a notification for order events."""
+    start_notification_worker()
+    print(f"Notification queued: Order {order_id} - {event}")
+    notification_queue.put((order_id, event, data or {}))
+
+
+def start_notification_worker():
+    """Start the delivery worker if this process doesn't have one yet."""
+    global _notification_worker_pid
+    with _notification_worker_lock:
+        if _notification_worker_pid == os.getpid():
+            return
+        # Daemon thread, so a stuck delivery can't keep the process alive
+        worker = threading.Thread(target=deliver_notifications, daemon=True)
+        worker.start()
+        atexit.register(stop_notification_worker, worker)
+        _notification_worker_pid = os.getpid()
+
+
+def stop_notification_worker(worker: threading.Thread):
+    """Let the worker deliver everything already queued, then stop it."""
+    notification_queue.put(_STOP_WORKER)
+    worker.join(timeout=5)
+
+
+def deliver_notifications():
+    """Deliver queued notifications in batches until told to stop."""
+    while True:
+        # Block until there is work, then collect whatever else arrives shortly
+        batch = []
+        item = notification_queue.get()
+        while item is not _STOP_WORKER:
+            batch.append(item)
+            if len(batch) == NOTIFICATION_BATCH_SIZE:
+                break
+            try:
+                item = notification_queue.get(timeout=NOTIFICATION_BATCH_WAIT)
+            except queue.Empty:
+                break
+        for order_id, event, data in batch:
+            print(f"Notification: Order {order_id} - {event}")
+            # In production: send email, push notification, webhook, etc.
+        if item is _STOP_WORKER:
+            return
 
 
 def update_inventory(order_id: str, action: str):
@@ -93,23 +164,6 @@ class Order(clearskies.Model):
     # Order status with lifecycle hooks
     order_status = columns.Select(
         ["pending", "confirmed", "processing", "shipped", "delivered", "cancelled", "returned", "refunded"],
-        on_change_pre_save={
-            "confirmed": lambda data, model: {
-                "confirmed_at": datetime.utcnow(),
-            },
-            "processing": lambda data, model: {
-                "processing_started_at": datetime.utcnow(),
-            },
-            "shipped": lambda data, model: {
-                "shipped_at": datetime.utcnow(),
-            },
-            "delivered": lambda data, model: {
-                "delivered_at": datetime.utcnow(),
-            },
-            "cancelled": lambda data, model: {
-                "cancelled_at": datetime.utcnow(),
-            },
-        },
         on_change_post_save={
             "confirmed": lambda data, model, id: send_notification(id, "order_confirmed"),
             "shipped": lambda data, model, id: send_notification(id, "order_shipped"),
@@ -127,7 +181,7 @@ class Order(clearskies.Model):
         },
     )
 
-    # Timestamps for each state
+    # Timestamps for each state (set in pre_save from ORDER_STATUS_TIMESTAMPS)
     confirmed_at = columns.Datetime()
     processing_started_at = columns.Datetime()
     shipped_at = columns.Datetime()
@@ -147,47 +201,56 @@ class Order(clearskies.Model):
 
     def pre_save(self, data):
         """Validate state transitions and track history."""
+        # Read the current state and the clock once up front
+        now = datetime.utcnow()
+        exists = self.exists
+        current_order_status = self.order_status if exists else None
+        current_payment_status = self.payment_status if exists else None
+
         # Validate order status transition
         if "order_status" in data:
-            current = self.order_status if self.exists else None
             new = data["order_status"]
-            if new not in ORDER_TRANSITIONS.get(current, []):
+            allowed = ORDER_TRANSITIONS.get(current_order_status, frozenset())
+            if new not in allowed:
                 raise ValueError(
-                    f"Invalid order status transition: '{current}' -> '{new}'. "
-                    f"Valid transitions: {ORDER_TRANSITIONS.get(current, [])}"
+                    f"Invalid order status transition: '{current_order_status}' -> '{new}'. "
+                    f"Valid transitions: {sorted(allowed)}"
                 )
+            timestamp_column = ORDER_STATUS_TIMESTAMPS.get(new)
+            if timestamp_column:
+                data[timestamp_column] = now
 
         # Validate payment status transition
         if "payment_status" in data:
-            current = self.payment_status if self.exists else None
             new = data["payment_status"]
-            if new not in PAYMENT_TRANSITIONS.get(current, []):
+            allowed = PAYMENT_TRANSITIONS.get(current_payment_status, frozenset())
+            if new not in allowed:
                 raise ValueError(
-                    f"Invalid payment status transition: '{current}' -> '{new}'. "
-                    f"Valid transitions: {PAYMENT_TRANSITIONS.get(current, [])}"
+                    f"Invalid payment status transition: '{current_payment_status}' -> '{new}'. "
+                    f"Valid transitions: {sorted(allowed)}"
                 )
 
-        # Track status history
-        history = self.status_history.copy() if self.exists else []
+        # Track status history, only rewriting it when something changed
+        new_entries = []
 
-        if "order_status" in data and (not self.exists or data["order_status"] != self.order_status):
-            history.append({
+        if "order_status" in data and data["order_status"] != current_order_status:
+            new_entries.append({
                 "type": "order_status",
-                "from": self.order_status if self.exists else None,
+                "from": current_order_status,
                 "to": data["order_status"],
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now.isoformat(),
             })
 
-        if "payment_status" in data and (not self.exists or data["payment_status"] != self.payment_status):
-            history.append({
+        if "payment_status" in data and data["payment_status"] != current_payment_status:
+            new_entries.append({
                 "type": "payment_status",
-                "from": self.payment_status if self.exists else None,
+                "from": current_payment_status,
                 "to": data["payment_status"],
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now.isoformat(),
             })
 
-        if history != (self.status_history if self.exists else []):
-            data["status_history"] = history
+        if new_entries:
+            data["status_history"] = (self.status_history if exists else []) + new_entries
 
         return data
 
@@ -319,22 +382,25 @@ class Order(clearskies.Model):
     # ANALYTICS METHODS
     # =============================================================================
 
+    def get_status_durations(self) -> dict:
+        """Get total time spent in each order status (in seconds)."""
+        # One pass: each order status change closes out the time spent in the previous status
+        totals = {}
+        current, entered_at = None, None
+        for entry in self.status_history:
+            if entry["type"] != "order_status":
+                continue
+            timestamp = datetime.fromisoformat(entry["timestamp"])
+            if current is not None:
+                totals[current] = totals.get(current, 0) + (timestamp - entered_at).total_seconds()
+            current, entered_at = entry["to"], timestamp
+        if current is not None:
+            totals[current] = totals.get(current, 0) + (datetime.utcnow() - entered_at).total_seconds()
+        return totals
+
     def get_time_in_status(self, status: str) -> float:
         """Get total time spent in a specific status (in seconds)."""
-        total = 0
-        for i, entry in enumerate(self.status_history):
-            if entry["type"] == "order_status" and entry["to"] == status:
-                start = datetime.fromisoformat(entry["timestamp"])
-                # Find when we left this status
-                end = None
-                for j in range(i + 1, len(self.status_history)):
-                    if self.status_history[j]["type"] == "order_status":
-                        end = datetime.fromisoformat(self.status_history[j]["timestamp"])
-                        break
-                if end is None:
-                    end = datetime.utcnow()
-                total += (end - start).total_seconds()
-        return total
+        return self.get_status_durations().get(status, 0)
 
     def get_processing_time(self) -> float:
         """Get total processing time from confirmed to shipped."""
@@ -398,7 +464,7 @@ if __name__ == "__main__":
 1. **State Transition Validation** - Only allow valid transitions between states
 2. **Multiple State Machines** - Independent order and payment status tracking
 3. **State History** - Track all state changes with timestamps
-4. **Lifecycle Hooks** - Automatic timestamps and notifications on state changes
+4. **Lifecycle Hooks** - Timestamps set in pre_save; notifications via on_change_post_save
 5. **Business Logic Methods** - Encapsulate state transitions in methods
 6. **Query Methods** - Check if transitions are allowed before attempting
 7. **Analytics** - Calculate time spent in each status
@@ -5,101 +5,15 @@ This module provides utilities for introspecting clearskies column types,
 endpoint types, backend types, context types, and many more module categories.
 """
 
+import importlib
 import inspect
 import json
+import logging
+from functools import lru_cache
 from typing import Any, Mapping
 
-import clearskies
-import clearskies.authentication
-import clearskies.backends
-import clearskies.columns
-import clearskies.contexts
-import clearskies.endpoints
-
-# Optional imports - some modules may not exist in all clearskies versions
-try:
-    import clearskies.validators
-
-    _HAS_VALIDATORS = True
-except ImportError:
-    _HAS_VALIDATORS = False
-
-try:
-    import clearskies.exceptions
-
-    _HAS_EXCEPTIONS = True
-except ImportError:
-    _HAS_EXCEPTIONS = False
-
-try:
-    import clearskies.di
-
-    _HAS_DI = True
-except ImportError:
-    _HAS_DI = False
-
-try:
-    import clearskies.cursors
-
-    _HAS_CURSORS = True
-except ImportError:
-    _HAS_CURSORS = False
-
-try:
-    import clearskies.input_outputs
-
-    _HAS_INPUT_OUTPUTS = True
-except ImportError:
-    _HAS_INPUT_OUTPUTS = False
-
-try:
-    import clearskies.configs
-
-    _HAS_CONFIGS = True
-except ImportError:
-    _HAS_CONFIGS = False
-
-try:
-    import clearskies.clients
-
-    _HAS_CLIENTS = True
-except ImportError:
-    _HAS_CLIENTS = False
-
-try:
-    import clearskies.secrets
-
-    _HAS_SECRETS = True
-except ImportError:
-    _HAS_SECRETS = False
-
-try:
-    import clearskies.security_headers
-
-    _HAS_SECURITY_HEADERS = True
-except ImportError:
-    _HAS_SECURITY_HEADERS = False
-
-try:
-    import clearskies.functional
-
-    _HAS_FUNCTIONAL = True
-except ImportError:
-    _HAS_FUNCTIONAL = False
-
-try:
-    import clearskies.query
-
-    _HAS_QUERY = True
-except ImportError:
-    _HAS_QUERY = False
-
-try:
-    import clearskies.query.result
-
-    _HAS_QUERY_RESULTS = True
-except ImportError:
-    _HAS_QUERY_RESULTS = False
+# Never print from here: on the stdio transport stdout is the JSON-RPC stream.
+logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
@@ -137,7 +51,7 @@ def safe_introspect_module(module, module_name: str, filter_func=None) -> dict[s
         return result
 
     except Exception as e:
-        print(f"Warning: Could not introspect {module_name}: {e}")
+        logger.warning("Could not introspect %s: %s", module_name, e)
         return {}
 
 
@@ -169,183 +83,118 @@ def safe_introspect_module_all(module, module_name: str) -> dict[str, Any]:
         return result
 
     except Exception as e:
-        print(f"Warning: Could not introspect {module_name}: {e}")
+        logger.warning("Could not introspect %s: %s", module_name, e)
         return {}
 
 
 # ---------------------------------------------------------------------------
-# Type registries - Core (always available)
-# ---------------------------------------------------------------------------
-COLUMN_TYPES: dict[str, type] = {
-    name: getattr(clearskies.columns, name)
-    for name in clearskies.columns.__all__
-    if inspect.isclass(getattr(clearskies.columns, name, None))
+# Type registries
+#
+# Each registry is built the first time it is used rather than at import, so a
+# server that only ever asks about columns never imports or walks the other
+# clearskies modules. Some modules may not exist in all clearskies versions;
+# their registries are empty.
+# ---------------------------------------------------------------------------
+_REGISTRY_MODULES = {
+    "columns": "clearskies.columns",
+    "endpoints": "clearskies.endpoints",
+    "backends": "clearskies.backends",
+    "contexts": "clearskies.contexts",
+    "authentication": "clearskies.authentication",
+    "validators": "clearskies.validators",
+    "exceptions": "clearskies.exceptions",
+    "di_inject": "clearskies.di.inject",
+    "cursors": "clearskies.cursors",
+    "input_outputs": "clearskies.input_outputs",
+    "configs": "clearskies.configs",
+    "clients": "clearskies.clients",
+    "secrets": "clearskies.secrets",
+    "security_headers": "clearskies.security_headers",
+    "query": "clearskies.query",
+    "query_results": "clearskies.query.result",
+    "functional": "clearskies.functional",
 }
 
-ENDPOINT_TYPES: dict[str, type] = {
-    name: getattr(clearskies.endpoints, name)
-    for name in clearskies.endpoints.__all__
-    if inspect.isclass(getattr(clearskies.endpoints, name, None))
+# Module-level registry names, resolved lazily by __getattr__ below
+_REGISTRY_ATTRIBUTES = {
+    "COLUMN_TYPES": "columns",
+    "ENDPOINT_TYPES": "endpoints",
+    "BACKEND_TYPES": "backends",
+    "CONTEXT_TYPES": "contexts",
+    "AUTHENTICATION_TYPES": "authentication",
+    "VALIDATOR_TYPES": "validators",
+    "EXCEPTION_TYPES": "exceptions",
+    "DI_INJECT_TYPES": "di_inject",
+    "CURSOR_TYPES": "cursors",
+    "INPUT_OUTPUT_TYPES": "input_outputs",
+    "CONFIG_TYPES": "configs",
+    "CLIENT_TYPES": "clients",
+    "SECRET_TYPES": "secrets",
+    "SECURITY_HEADER_TYPES": "security_headers",
+    "QUERY_TYPES": "query",
+    "QUERY_RESULT_TYPES": "query_results",
+    "FUNCTIONAL_ITEMS": "functional",
 }
 
-BACKEND_TYPES: dict[str, type] = {
-    name: getattr(clearskies.backends, name)
-    for name in clearskies.backends.__all__
-    if inspect.isclass(getattr(clearskies.backends, name, None))
-}
-
-CONTEXT_TYPES: dict[str, type] = {
-    name: getattr(clearskies.contexts, name)
-    for name in clearskies.contexts.__all__
-    if inspect.isclass(getattr(clearskies.contexts, name, None))
-}
-
-# ---------------------------------------------------------------------------
-# Type registries - Authentication
-# ---------------------------------------------------------------------------
-AUTHENTICATION_TYPES: dict[str, type] = safe_introspect_module(clearskies.authentication, "clearskies.authentication")
-
-# ---------------------------------------------------------------------------
-# Type registries - Validators (if available)
-# ---------------------------------------------------------------------------
+COLUMN_TYPES: dict[str, type]
+ENDPOINT_TYPES: dict[str, type]
+BACKEND_TYPES: dict[str, type]
+CONTEXT_TYPES: dict[str, type]
+AUTHENTICATION_TYPES: dict[str, type]
 VALIDATOR_TYPES: dict[str, type]
-if _HAS_VALIDATORS:
-    VALIDATOR_TYPES = safe_introspect_module(clearskies.validators, "clearskies.validators")
-else:
-    VALIDATOR_TYPES = {}
-
-# ---------------------------------------------------------------------------
-# Type registries - Exceptions (if available)
-# ---------------------------------------------------------------------------
 EXCEPTION_TYPES: dict[str, type]
-if _HAS_EXCEPTIONS:
-    EXCEPTION_TYPES = safe_introspect_module(
-        clearskies.exceptions, "clearskies.exceptions", filter_func=lambda cls: issubclass(cls, BaseException)
-    )
-else:
-    EXCEPTION_TYPES = {}
-
-# ---------------------------------------------------------------------------
-# Type registries - DI Inject helpers (if available)
-# ---------------------------------------------------------------------------
 DI_INJECT_TYPES: dict[str, type]
-if _HAS_DI:
-    try:
-        import clearskies.di.inject
-
-        DI_INJECT_TYPES = safe_introspect_module(clearskies.di.inject, "clearskies.di.inject")
-    except (ImportError, AttributeError):
-        DI_INJECT_TYPES = {}
-else:
-    DI_INJECT_TYPES = {}
-
-# ---------------------------------------------------------------------------
-# Type registries - Cursors (if available)
-# ---------------------------------------------------------------------------
 CURSOR_TYPES: dict[str, type]
-if _HAS_CURSORS:
-    CURSOR_TYPES = safe_introspect_module(clearskies.cursors, "clearskies.cursors")
-else:
-    CURSOR_TYPES = {}
-
-# ---------------------------------------------------------------------------
-# Type registries - Input/Outputs (if available)
-# ---------------------------------------------------------------------------
 INPUT_OUTPUT_TYPES: dict[str, type]
-if _HAS_INPUT_OUTPUTS:
-    INPUT_OUTPUT_TYPES = safe_introspect_module(clearskies.input_outputs, "clearskies.input_outputs")
-else:
-    INPUT_OUTPUT_TYPES = {}
-
-# ---------------------------------------------------------------------------
-# Type registries - Configs (if available)
-# ---------------------------------------------------------------------------
 CONFIG_TYPES: dict[str, type]
-if _HAS_CONFIGS:
-    CONFIG_TYPES = safe_introspect_module(clearskies.configs, "clearskies.configs")
-else:
-    CONFIG_TYPES = {}
-
-# ---------------------------------------------------------------------------
-# Type registries - Clients (if available)
-# ---------------------------------------------------------------------------
 CLIENT_TYPES: dict[str, type]
-if _HAS_CLIENTS:
-    CLIENT_TYPES = safe_introspect_module(clearskies.clients, "clearskies.clients")
-else:
-    CLIENT_TYPES = {}
-
-# ---------------------------------------------------------------------------
-# Type registries - Secrets (if available)
-# ---------------------------------------------------------------------------
 SECRET_TYPES: dict[str, type]
-if _HAS_SECRETS:
-    SECRET_TYPES = safe_introspect_module(clearskies.secrets, "clearskies.secrets")
-else:
-    SECRET_TYPES = {}
-
-# ---------------------------------------------------------------------------
-# Type registries - Security Headers (if available)
-# ---------------------------------------------------------------------------
 SECURITY_HEADER_TYPES: dict[str, type]
-if _HAS_SECURITY_HEADERS:
-    SECURITY_HEADER_TYPES = safe_introspect_module(clearskies.security_headers, "clearskies.security_headers")
-else:
-    SECURITY_HEADER_TYPES = {}
-
-# ---------------------------------------------------------------------------
-# Type registries - Query (if available)
-# ---------------------------------------------------------------------------
 QUERY_TYPES: dict[str, type]
-if _HAS_QUERY:
-    QUERY_TYPES = safe_introspect_module(clearskies.query, "clearskies.query")
-else:
-    QUERY_TYPES = {}
-
-# ---------------------------------------------------------------------------
-# Type registries - Query Results (if available)
-# ---------------------------------------------------------------------------
 QUERY_RESULT_TYPES: dict[str, type]
-if _HAS_QUERY_RESULTS:
-    QUERY_RESULT_TYPES = safe_introspect_module(clearskies.query.result, "clearskies.query.result")
-else:
-    QUERY_RESULT_TYPES = {}
-
-# ---------------------------------------------------------------------------
-# Type registries - Functional utilities (if available)
 # Functional utilities might not all be classes
-# ---------------------------------------------------------------------------
 FUNCTIONAL_ITEMS: dict[str, Any]
-if _HAS_FUNCTIONAL:
-    FUNCTIONAL_ITEMS = safe_introspect_module_all(clearskies.functional, "clearskies.functional")
-else:
-    FUNCTIONAL_ITEMS = {}
+ALL_TYPE_REGISTRIES: dict[str, dict]
+
+
+@lru_cache(maxsize=None)
+def _load_registry(category: str) -> dict[str, Any]:
+    """Import and introspect the clearskies module for a registry category.
+
+    Args:
+        category: The category name (a key of _REGISTRY_MODULES)
+
+    Returns:
+        Dictionary mapping type names to type objects, empty if the module is unavailable
+    """
+    module_name = _REGISTRY_MODULES[category]
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return {}
+
+    if category == "functional":
+        return safe_introspect_module_all(module, module_name)
+    if category == "exceptions":
+        return safe_introspect_module(module, module_name, filter_func=lambda cls: issubclass(cls, BaseException))
+    return safe_introspect_module(module, module_name)
+
+
+def __getattr__(name: str) -> Any:
+    """Build a registry the first time its module-level name is accessed."""
+    if name == "ALL_TYPE_REGISTRIES":
+        return {category: _load_registry(category) for category in _REGISTRY_MODULES}
+    category = _REGISTRY_ATTRIBUTES.get(name)
+    if category is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    registry = _load_registry(category)
+    globals()[name] = registry
+    return registry
 
 
 # ---------------------------------------------------------------------------
 # Registry lookup helpers
 # ---------------------------------------------------------------------------
-ALL_TYPE_REGISTRIES = {
-    "columns": COLUMN_TYPES,
-    "endpoints": ENDPOINT_TYPES,
-    "backends": BACKEND_TYPES,
-    "contexts": CONTEXT_TYPES,
-    "authentication": AUTHENTICATION_TYPES,
-    "validators": VALIDATOR_TYPES,
-    "exceptions": EXCEPTION_TYPES,
-    "di_inject": DI_INJECT_TYPES,
-    "cursors": CURSOR_TYPES,
-    "input_outputs": INPUT_OUTPUT_TYPES,
-    "configs": CONFIG_TYPES,
-    "clients": CLIENT_TYPES,
-    "secrets": SECRET_TYPES,
-    "security_headers": SECURITY_HEADER_TYPES,
-    "query": QUERY_TYPES,
-    "query_results": QUERY_RESULT_TYPES,
-    "functional": FUNCTIONAL_ITEMS,
-}
-
-
 def get_type_registry(category: str) -> dict:
     """Get the type registry for a specific category.
 
@@ -355,7 +204,9 @@ def get_type_registry(category: str) -> dict:
     Returns:
         Dictionary mapping type names to type objects
     """
-    return ALL_TYPE_REGISTRIES.get(category, {})
+    if category not in _REGISTRY_MODULES:
+        return {}
+    return _load_registry(category)
 
 
 def get_all_categories() -> list[str]:
@@ -364,7 +215,7 @@ def get_all_categories() -> list[str]:
     Returns:
         List of category names
     """
-    return list(ALL_TYPE_REGISTRIES.keys())
+    return list(_REGISTRY_MODULES)
 
 
 def get_available_categories() -> list[str]:
@@ -373,7 +224,7 @@ def get_available_categories() -> list[str]:
     Returns:
         List of category names with available types
     """
-    return [cat for cat, types in ALL_TYPE_REGISTRIES.items() if types]
+    return [cat for cat in _REGISTRY_MODULES if _load_registry(cat)]
 
 
 # ---------------------------------------------------------------------------
@@ -10,9 +10,13 @@ import importlib
 import importlib.metadata
 import inspect
 import json
+import logging
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
+# Never print from here: on the stdio transport stdout is the JSON-RPC stream.
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Component categories to discover (matching introspection.py categories)
 # ---------------------------------------------------------------------------
@@ -251,7 +255,7 @@ class ModuleInfo:
                     continue
 
         except Exception as e:
-            print(f"Warning: Could not introspect {module_name}: {e}")
+            logger.warning("Could not introspect %s: %s", module_name, e)
 
         return components
 
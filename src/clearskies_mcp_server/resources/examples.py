@@ -2,28 +2,81 @@
 Example resources for clearskies framework.
 
 This module provides resource functions that return example code snippets.
-It delegates to the examples/ module for the actual content.
+It delegates to the examples/ module for the actual content. The example
+submodules are resolved when a resource is read rather than when the server
+starts, so unused examples are never imported.
 """
 
-from ..examples import (
-    example_advanced_queries,
-    example_api_backend,
-    example_audit_trail,
-    example_authentication,
-    example_authorization,
-    example_cli_app,
-    example_configuration,
-    example_endpoint_group,
-    example_error_handling,
-    example_hierarchical_data,
-    example_migrations,
-    example_pivot_data,
-    example_relationships,
-    example_restful_api,
-    example_secrets_backend,
-    example_state_machine_advanced,
-    example_testing,
-)
+from .. import examples
+
+
+def example_advanced_queries() -> str:
+    return examples.example_advanced_queries()
+
+
+def example_api_backend() -> str:
+    return examples.example_api_backend()
+
+
+def example_audit_trail() -> str:
+    return examples.example_audit_trail()
+
+
+def example_authentication() -> str:
+    return examples.example_authentication()
+
+
+def example_authorization() -> str:
+    return examples.example_authorization()
+
+
+def example_cli_app() -> str:
+    return examples.example_cli_app()
+
+
+def example_configuration() -> str:
+    return examples.example_configuration()
+
+
+def example_endpoint_group() -> str:
+    return examples.example_endpoint_group()
+
+
+def example_error_handling() -> str:
+    return examples.example_error_handling()
+
+
+def example_hierarchical_data() -> str:
+    return examples.example_hierarchical_data()
+
+
+def example_migrations() -> str:
+    return examples.example_migrations()
+
+
+def example_pivot_data() -> str:
+    return examples.example_pivot_data()
+
+
+def example_relationships() -> str:
+    return examples.example_relationships()
+
+
+def example_restful_api() -> str:
+    return examples.example_restful_api()
+
+
+def example_secrets_backend() -> str:
+    return examples.example_secrets_backend()
+
+
+def example_state_machine_advanced() -> str:
+    return examples.example_state_machine_advanced()
+
+
+def example_testing() -> str:
+    return examples.example_testing()
+
 
 __all__ = [
     "example_restful_api",
@@ -117,6 +117,7 @@ from .tools import (
     get_client_info,
     # Core type info
     get_column_info,
+    get_concept_section,
     get_config_info,
     get_context_info,
     get_cursor_info,
@@ -214,8 +215,9 @@ mcp.tool()(get_query_info)
 mcp.tool()(get_query_result_info)
 mcp.tool()(get_functional_info)
 
-# Concept explanation tool
+# Concept explanation tools
 mcp.tool()(explain_concept)
+mcp.tool()(get_concept_section)
 
 # Generation tools
 mcp.tool()(generate_model)
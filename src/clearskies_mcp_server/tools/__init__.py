@@ -13,6 +13,7 @@ from .documentation import (
     get_client_info,
     # Core type info
     get_column_info,
+    get_concept_section,
     get_config_info,
     get_context_info,
     get_cursor_info,
@@ -115,6 +116,7 @@ __all__ = [
     "get_functional_info",
     # Concept explanation
     "explain_concept",
+    "get_concept_section",
     # Generation tools
     "generate_model",
     "generate_endpoint",
@@ -4,25 +4,12 @@ Documentation tools for clearskies MCP server.
 This module contains tools for listing and documenting clearskies types.
 """
 
-from ..concepts import CONCEPT_EXPLANATIONS
+import re
+from functools import lru_cache
+
+from .. import introspection
+from ..concepts import CONCEPT_EXPLANATIONS, CONCEPT_NAMES
 from ..introspection import (
-    AUTHENTICATION_TYPES,
-    BACKEND_TYPES,
-    CLIENT_TYPES,
-    COLUMN_TYPES,
-    CONFIG_TYPES,
-    CONTEXT_TYPES,
-    CURSOR_TYPES,
-    DI_INJECT_TYPES,
-    ENDPOINT_TYPES,
-    EXCEPTION_TYPES,
-    FUNCTIONAL_ITEMS,
-    INPUT_OUTPUT_TYPES,
-    QUERY_RESULT_TYPES,
-    QUERY_TYPES,
-    SECRET_TYPES,
-    SECURITY_HEADER_TYPES,
-    VALIDATOR_TYPES,
     get_class_info,
     get_docstring,
     get_init_params,
@@ -36,22 +23,22 @@ from ..introspection import (
 
 def list_available_columns() -> str:
     """List all available clearskies column types with a short description of each."""
-    return list_types_formatted(COLUMN_TYPES)
+    return list_types_formatted(introspection.COLUMN_TYPES)
 
 
 def list_available_endpoints() -> str:
     """List all available clearskies endpoint types with a short description of each."""
-    return list_types_formatted(ENDPOINT_TYPES)
+    return list_types_formatted(introspection.ENDPOINT_TYPES)
 
 
 def list_available_backends() -> str:
     """List all available clearskies backend types with a short description of each."""
-    return list_types_formatted(BACKEND_TYPES)
+    return list_types_formatted(introspection.BACKEND_TYPES)
 
 
 def list_available_contexts() -> str:
     """List all available clearskies context types with a short description of each."""
-    return list_types_formatted(CONTEXT_TYPES)
+    return list_types_formatted(introspection.CONTEXT_TYPES)
 
 
 # ---------------------------------------------------------------------------
@@ -73,9 +60,9 @@ def list_available_authentication() -> str:
             )
         )
     """
-    if not AUTHENTICATION_TYPES:
+    if not introspection.AUTHENTICATION_TYPES:
         return "(no authentication types available - module may not be installed)"
-    return list_types_formatted(AUTHENTICATION_TYPES)
+    return list_types_formatted(introspection.AUTHENTICATION_TYPES)
 
 
 def list_available_validators() -> str:
@@ -87,9 +74,9 @@ def list_available_validators() -> str:
     Example:
         name = columns.String(validators=[Required(), MinLength(3)])
     """
-    if not VALIDATOR_TYPES:
+    if not introspection.VALIDATOR_TYPES:
         return "(no validator types available - module may not be installed)"
-    return list_types_formatted(VALIDATOR_TYPES)
+    return list_types_formatted(introspection.VALIDATOR_TYPES)
 
 
 def list_available_exceptions() -> str:
@@ -98,9 +85,9 @@ def list_available_exceptions() -> str:
     These are the exceptions that clearskies may raise during operation. Understanding
     these helps with proper error handling in your application.
     """
-    if not EXCEPTION_TYPES:
+    if not introspection.EXCEPTION_TYPES:
         return "(no exception types available - module may not be installed)"
-    return list_types_formatted(EXCEPTION_TYPES)
+    return list_types_formatted(introspection.EXCEPTION_TYPES)
 
 
 def list_available_di_inject() -> str:
@@ -114,9 +101,9 @@ def list_available_di_inject() -> str:
             def __init__(self, utcnow: clearskies.di.inject.Utcnow):
                 self.utcnow = utcnow
     """
-    if not DI_INJECT_TYPES:
+    if not introspection.DI_INJECT_TYPES:
         return "(no DI inject types available - module may not be installed)"
-    return list_types_formatted(DI_INJECT_TYPES)
+    return list_types_formatted(introspection.DI_INJECT_TYPES)
 
 
 def list_available_cursors() -> str:
@@ -125,9 +112,9 @@ def list_available_cursors() -> str:
     Cursors are used internally by backends to execute database queries. Understanding
     these is useful for advanced backend customization.
     """
-    if not CURSOR_TYPES:
+    if not introspection.CURSOR_TYPES:
         return "(no cursor types available - module may not be installed)"
-    return list_types_formatted(CURSOR_TYPES)
+    return list_types_formatted(introspection.CURSOR_TYPES)
 
 
 def list_available_input_outputs() -> str:
@@ -136,9 +123,9 @@ def list_available_input_outputs() -> str:
     Input/output handlers define how data is read from requests and written to responses.
     They handle serialization formats like JSON, form data, etc.
     """
-    if not INPUT_OUTPUT_TYPES:
+    if not introspection.INPUT_OUTPUT_TYPES:
         return "(no input/output types available - module may not be installed)"
-    return list_types_formatted(INPUT_OUTPUT_TYPES)
+    return list_types_formatted(introspection.INPUT_OUTPUT_TYPES)
 
 
 def list_available_configs() -> str:
@@ -146,9 +133,9 @@ def list_available_configs() -> str:
 
     Configuration types are used to configure various aspects of clearskies behavior.
     """
-    if not CONFIG_TYPES:
+    if not introspection.CONFIG_TYPES:
         return "(no config types available - module may not be installed)"
-    return list_types_formatted(CONFIG_TYPES)
+    return list_types_formatted(introspection.CONFIG_TYPES)
 
 
 def list_available_clients() -> str:
@@ -156,9 +143,9 @@ def list_available_clients() -> str:
 
     Client types are used for making HTTP/API requests to external services.
     """
-    if not CLIENT_TYPES:
+    if not introspection.CLIENT_TYPES:
         return "(no client types available - module may not be installed)"
-    return list_types_formatted(CLIENT_TYPES)
+    return list_types_formatted(introspection.CLIENT_TYPES)
 
 
 def list_available_secrets() -> str:
@@ -167,9 +154,9 @@ def list_available_secrets() -> str:
     Secrets handlers provide secure access to sensitive configuration values like
     API keys, database passwords, etc.
     """
-    if not SECRET_TYPES:
+    if not introspection.SECRET_TYPES:
         return "(no secret types available - module may not be installed)"
-    return list_types_formatted(SECRET_TYPES)
+    return list_types_formatted(introspection.SECRET_TYPES)
 
 
 def list_available_security_headers() -> str:
@@ -178,9 +165,9 @@ def list_available_security_headers() -> str:
     Security header handlers add security-related HTTP headers to responses,
     such as CORS headers, CSP, etc.
     """
-    if not SECURITY_HEADER_TYPES:
+    if not introspection.SECURITY_HEADER_TYPES:
         return "(no security header types available - module may not be installed)"
-    return list_types_formatted(SECURITY_HEADER_TYPES)
+    return list_types_formatted(introspection.SECURITY_HEADER_TYPES)
 
 
 def list_available_query() -> str:
@@ -188,9 +175,9 @@ def list_available_query() -> str:
 
     Query builders are used to construct database queries programmatically.
     """
-    if not QUERY_TYPES:
+    if not introspection.QUERY_TYPES:
         return "(no query types available - module may not be installed)"
-    return list_types_formatted(QUERY_TYPES)
+    return list_types_formatted(introspection.QUERY_TYPES)
 
 
 def list_available_query_results() -> str:
@@ -198,9 +185,9 @@ def list_available_query_results() -> str:
 
     Query result types handle the results returned from database queries.
     """
-    if not QUERY_RESULT_TYPES:
+    if not introspection.QUERY_RESULT_TYPES:
         return "(no query result types available - module may not be installed)"
-    return list_types_formatted(QUERY_RESULT_TYPES)
+    return list_types_formatted(introspection.QUERY_RESULT_TYPES)
 
 
 def list_available_functional() -> str:
@@ -208,10 +195,10 @@ def list_available_functional() -> str:
 
     Functional utilities provide helper functions and decorators for common patterns.
     """
-    if not FUNCTIONAL_ITEMS:
+    if not introspection.FUNCTIONAL_ITEMS:
         return "(no functional utilities available - module may not be installed)"
     lines = []
-    for name, item in sorted(FUNCTIONAL_ITEMS.items()):
+    for name, item in sorted(introspection.FUNCTIONAL_ITEMS.items()):
         doc = get_docstring(item) if hasattr(item, "__doc__") else ""
         first_line = doc.split("\n")[0] if doc else "(no description)"
         lines.append(f"- **{name}**: {first_line}")
@@ -229,9 +216,9 @@ def get_column_info(column_type: str) -> str:
     Args:
         column_type: The name of the column type (e.g. "String", "Integer", "BelongsToId").
     """
-    cls = COLUMN_TYPES.get(column_type)
+    cls = introspection.COLUMN_TYPES.get(column_type)
     if cls is None:
-        available = ", ".join(sorted(COLUMN_TYPES))
+        available = ", ".join(sorted(introspection.COLUMN_TYPES))
         return f"Unknown column type '{column_type}'. Available types: {available}"
     return get_class_info(cls, "Column")
 
@@ -242,9 +229,9 @@ def get_endpoint_info(endpoint_type: str) -> str:
     Args:
         endpoint_type: The name of the endpoint type (e.g. "RestfulApi", "Create", "List").
     """
-    cls = ENDPOINT_TYPES.get(endpoint_type)
+    cls = introspection.ENDPOINT_TYPES.get(endpoint_type)
     if cls is None:
-        available = ", ".join(sorted(ENDPOINT_TYPES))
+        available = ", ".join(sorted(introspection.ENDPOINT_TYPES))
         return f"Unknown endpoint type '{endpoint_type}'. Available types: {available}"
     return get_class_info(cls, "Endpoint")
 
@@ -255,9 +242,9 @@ def get_backend_info(backend_type: str) -> str:
     Args:
         backend_type: The name of the backend type (e.g. "MemoryBackend", "CursorBackend", "ApiBackend").
     """
-    cls = BACKEND_TYPES.get(backend_type)
+    cls = introspection.BACKEND_TYPES.get(backend_type)
     if cls is None:
-        available = ", ".join(sorted(BACKEND_TYPES))
+        available = ", ".join(sorted(introspection.BACKEND_TYPES))
         return f"Unknown backend type '{backend_type}'. Available types: {available}"
     return get_class_info(cls, "Backend")
 
@@ -268,9 +255,9 @@ def get_context_info(context_type: str) -> str:
     Args:
         context_type: The name of the context type (e.g. "Cli", "WsgiRef", "Wsgi").
     """
-    cls = CONTEXT_TYPES.get(context_type)
+    cls = introspection.CONTEXT_TYPES.get(context_type)
     if cls is None:
-        available = ", ".join(sorted(CONTEXT_TYPES))
+        available = ", ".join(sorted(introspection.CONTEXT_TYPES))
         return f"Unknown context type '{context_type}'. Available types: {available}"
     return get_class_info(cls, "Context")
 
@@ -286,11 +273,11 @@ def get_authentication_info(auth_type: str) -> str:
     Args:
         auth_type: The auth type name (e.g. "SecretBearer", "JWKS", "SecretBasic").
     """
-    if not AUTHENTICATION_TYPES:
+    if not introspection.AUTHENTICATION_TYPES:
         return "Authentication module not available in this clearskies installation."
-    cls = AUTHENTICATION_TYPES.get(auth_type)
+    cls = introspection.AUTHENTICATION_TYPES.get(auth_type)
     if cls is None:
-        available = ", ".join(sorted(AUTHENTICATION_TYPES))
+        available = ", ".join(sorted(introspection.AUTHENTICATION_TYPES))
         return f"Unknown authentication type '{auth_type}'. Available types: {available}"
     return get_class_info(cls, "Authentication")
 
@@ -301,11 +288,11 @@ def get_validator_info(validator_type: str) -> str:
     Args:
         validator_type: The validator type name (e.g. "Required", "Unique", "Email").
     """
-    if not VALIDATOR_TYPES:
+    if not introspection.VALIDATOR_TYPES:
         return "Validators module not available in this clearskies installation."
-    cls = VALIDATOR_TYPES.get(validator_type)
+    cls = introspection.VALIDATOR_TYPES.get(validator_type)
     if cls is None:
-        available = ", ".join(sorted(VALIDATOR_TYPES))
+        available = ", ".join(sorted(introspection.VALIDATOR_TYPES))
         return f"Unknown validator type '{validator_type}'. Available types: {available}"
     return get_class_info(cls, "Validator")
 
@@ -316,11 +303,11 @@ def get_exception_info(exception_type: str) -> str:
     Args:
         exception_type: The exception type name (e.g. "InputError", "AuthenticationError").
     """
-    if not EXCEPTION_TYPES:
+    if not introspection.EXCEPTION_TYPES:
         return "Exceptions module not available in this clearskies installation."
-    cls = EXCEPTION_TYPES.get(exception_type)
+    cls = introspection.EXCEPTION_TYPES.get(exception_type)
     if cls is None:
-        available = ", ".join(sorted(EXCEPTION_TYPES))
+        available = ", ".join(sorted(introspection.EXCEPTION_TYPES))
         return f"Unknown exception type '{exception_type}'. Available types: {available}"
     return get_class_info(cls, "Exception")
 
@@ -331,11 +318,11 @@ def get_di_inject_info(inject_type: str) -> str:
     Args:
         inject_type: The inject type name (e.g. "ByClass", "Utcnow").
     """
-    if not DI_INJECT_TYPES:
+    if not introspection.DI_INJECT_TYPES:
         return "DI inject module not available in this clearskies installation."
-    cls = DI_INJECT_TYPES.get(inject_type)
+    cls = introspection.DI_INJECT_TYPES.get(inject_type)
     if cls is None:
-        available = ", ".join(sorted(DI_INJECT_TYPES))
+        available = ", ".join(sorted(introspection.DI_INJECT_TYPES))
         return f"Unknown DI inject type '{inject_type}'. Available types: {available}"
     return get_class_info(cls, "DI Inject")
 
@@ -346,11 +333,11 @@ def get_cursor_info(cursor_type: str) -> str:
     Args:
         cursor_type: The cursor type name.
     """
-    if not CURSOR_TYPES:
+    if not introspection.CURSOR_TYPES:
         return "Cursors module not available in this clearskies installation."
-    cls = CURSOR_TYPES.get(cursor_type)
+    cls = introspection.CURSOR_TYPES.get(cursor_type)
     if cls is None:
-        available = ", ".join(sorted(CURSOR_TYPES))
+        available = ", ".join(sorted(introspection.CURSOR_TYPES))
         return f"Unknown cursor type '{cursor_type}'. Available types: {available}"
     return get_class_info(cls, "Cursor")
 
@@ -361,11 +348,11 @@ def get_input_output_info(io_type: str) -> str:
     Args:
         io_type: The input/output type name.
     """
-    if not INPUT_OUTPUT_TYPES:
+    if not introspection.INPUT_OUTPUT_TYPES:
         return "Input/outputs module not available in this clearskies installation."
-    cls = INPUT_OUTPUT_TYPES.get(io_type)
+    cls = introspection.INPUT_OUTPUT_TYPES.get(io_type)
     if cls is None:
-        available = ", ".join(sorted(INPUT_OUTPUT_TYPES))
+        available = ", ".join(sorted(introspection.INPUT_OUTPUT_TYPES))
         return f"Unknown input/output type '{io_type}'. Available types: {available}"
     return get_class_info(cls, "Input/Output")
 
@@ -376,11 +363,11 @@ def get_config_info(config_type: str) -> str:
     Args:
         config_type: The config type name.
     """
-    if not CONFIG_TYPES:
+    if not introspection.CONFIG_TYPES:
         return "Configs module not available in this clearskies installation."
-    cls = CONFIG_TYPES.get(config_type)
+    cls = introspection.CONFIG_TYPES.get(config_type)
     if cls is None:
-        available = ", ".join(sorted(CONFIG_TYPES))
+        available = ", ".join(sorted(introspection.CONFIG_TYPES))
         return f"Unknown config type '{config_type}'. Available types: {available}"
     return get_class_info(cls, "Config")
 
@@ -391,11 +378,11 @@ def get_client_info(client_type: str) -> str:
     Args:
         client_type: The client type name.
     """
-    if not CLIENT_TYPES:
+    if not introspection.CLIENT_TYPES:
         return "Clients module not available in this clearskies installation."
-    cls = CLIENT_TYPES.get(client_type)
+    cls = introspection.CLIENT_TYPES.get(client_type)
     if cls is None:
-        available = ", ".join(sorted(CLIENT_TYPES))
+        available = ", ".join(sorted(introspection.CLIENT_TYPES))
         return f"Unknown client type '{client_type}'. Available types: {available}"
     return get_class_info(cls, "Client")
 
@@ -406,11 +393,11 @@ def get_secret_info(secret_type: str) -> str:
     Args:
         secret_type: The secret type name.
     """
-    if not SECRET_TYPES:
+    if not introspection.SECRET_TYPES:
         return "Secrets module not available in this clearskies installation."
-    cls = SECRET_TYPES.get(secret_type)
+    cls = introspection.SECRET_TYPES.get(secret_type)
     if cls is None:
-        available = ", ".join(sorted(SECRET_TYPES))
+        available = ", ".join(sorted(introspection.SECRET_TYPES))
         return f"Unknown secret type '{secret_type}'. Available types: {available}"
     return get_class_info(cls, "Secret")
 
@@ -421,11 +408,11 @@ def get_security_header_info(header_type: str) -> str:
     Args:
         header_type: The security header type name.
     """
-    if not SECURITY_HEADER_TYPES:
+    if not introspection.SECURITY_HEADER_TYPES:
         return "Security headers module not available in this clearskies installation."
-    cls = SECURITY_HEADER_TYPES.get(header_type)
+    cls = introspection.SECURITY_HEADER_TYPES.get(header_type)
     if cls is None:
-        available = ", ".join(sorted(SECURITY_HEADER_TYPES))
+        available = ", ".join(sorted(introspection.SECURITY_HEADER_TYPES))
         return f"Unknown security header type '{header_type}'. Available types: {available}"
     return get_class_info(cls, "Security Header")
 
@@ -436,11 +423,11 @@ def get_query_info(query_type: str) -> str:
     Args:
         query_type: The query type name.
     """
-    if not QUERY_TYPES:
+    if not introspection.QUERY_TYPES:
         return "Query module not available in this clearskies installation."
-    cls = QUERY_TYPES.get(query_type)
+    cls = introspection.QUERY_TYPES.get(query_type)
     if cls is None:
-        available = ", ".join(sorted(QUERY_TYPES))
+        available = ", ".join(sorted(introspection.QUERY_TYPES))
         return f"Unknown query type '{query_type}'. Available types: {available}"
     return get_class_info(cls, "Query")
 
@@ -451,11 +438,11 @@ def get_query_result_info(result_type: str) -> str:
     Args:
         result_type: The query result type name.
     """
-    if not QUERY_RESULT_TYPES:
+    if not introspection.QUERY_RESULT_TYPES:
         return "Query results module not available in this clearskies installation."
-    cls = QUERY_RESULT_TYPES.get(result_type)
+    cls = introspection.QUERY_RESULT_TYPES.get(result_type)
     if cls is None:
-        available = ", ".join(sorted(QUERY_RESULT_TYPES))
+        available = ", ".join(sorted(introspection.QUERY_RESULT_TYPES))
         return f"Unknown query result type '{result_type}'. Available types: {available}"
     return get_class_info(cls, "Query Result")
 
@@ -466,11 +453,11 @@ def get_functional_info(func_name: str) -> str:
     Args:
         func_name: The functional utility name.
     """
-    if not FUNCTIONAL_ITEMS:
+    if not introspection.FUNCTIONAL_ITEMS:
         return "Functional module not available in this clearskies installation."
-    item = FUNCTIONAL_ITEMS.get(func_name)
+    item = introspection.FUNCTIONAL_ITEMS.get(func_name)
     if item is None:
-        available = ", ".join(sorted(FUNCTIONAL_ITEMS))
+        available = ", ".join(sorted(introspection.FUNCTIONAL_ITEMS))
         return f"Unknown functional utility '{func_name}'. Available utilities: {available}"
 
     doc = get_docstring(item) if hasattr(item, "__doc__") else ""
@@ -508,8 +495,72 @@ def explain_concept(concept: str) -> str:
                  advanced_queries, configuration, logging, caching, async, state_machine_advanced,
                  secrets_backend.
     """
-    concept_lower = concept.lower().replace(" ", "_").replace("-", "_")
-    if concept_lower in CONCEPT_EXPLANATIONS:
-        return CONCEPT_EXPLANATIONS[concept_lower]
-    available = ", ".join(sorted(CONCEPT_EXPLANATIONS.keys()))
+    concept_lower = _normalize_concept_name(concept)
+    explanation = CONCEPT_EXPLANATIONS.get(concept_lower)
+    if explanation is not None:
+        return explanation
+    available = ", ".join(CONCEPT_NAMES)
     return f"Unknown concept '{concept}'. Available concepts: {available}"
+
+
+def get_concept_section(concept: str, section: str) -> str:
+    """Return a single section of a clearskies concept explanation.
+
+    Concept explanations can be long; use this to fetch just the part you need,
+    e.g. concept="column_reference", section="HasMany".
+
+    Args:
+        concept: The concept to read from. Accepts the same names as explain_concept.
+        section: The heading of the section to return (## or ### level, case-insensitive).
+    """
+    concept_lower = _normalize_concept_name(concept)
+    if concept_lower not in CONCEPT_EXPLANATIONS:
+        available = ", ".join(CONCEPT_NAMES)
+        return f"Unknown concept '{concept}'. Available concepts: {available}"
+
+    sections = _concept_sections(concept_lower)
+    span = sections.get(_section_slug(section))
+    if span is None:
+        available = ", ".join(heading for heading, _, _ in sections.values())
+        return f"Unknown section '{section}' in concept '{concept}'. Available sections: {available}"
+    _, start, end = span
+    return CONCEPT_EXPLANATIONS[concept_lower][start:end]
+
+
+def _normalize_concept_name(concept: str) -> str:
+    return concept.lower().replace(" ", "_").replace("-", "_")
+
+
+def _section_slug(heading: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", heading.lower()).strip("_")
+
+
+_SECTION_HEADING = re.compile(r"^(#{2,3}) (.+)$")
+
+
+@lru_cache(maxsize=None)
+def _concept_sections(concept: str) -> dict[str, tuple[str, int, int]]:
+    """Index the ## and ### sections of a concept as slug -> (heading, start, end).
+
+    A section runs until the next heading of the same or a higher level. Headings inside
+    fenced code blocks are ignored. The index is built on first use and cached; concept
+    text never changes at runtime.
+    """
+    text = CONCEPT_EXPLANATIONS[concept]
+    headings: list[tuple[int, str, int]] = []
+    in_code_block = False
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        if line.startswith("```"):
+            in_code_block = not in_code_block
+        elif not in_code_block:
+            match = _SECTION_HEADING.match(line)
+            if match:
+                headings.append((len(match.group(1)), match.group(2).strip(), offset))
+        offset += len(line)
+
+    sections: dict[str, tuple[str, int, int]] = {}
+    for index, (level, heading, start) in enumerate(headings):
+        end = next((later[2] for later in headings[index + 1 :] if later[0] <= level), len(text))
+        sections.setdefault(_section_slug(heading), (heading, start, end))
+    return sections
@@ -6,7 +6,7 @@ This module contains tools for generating clearskies models, endpoints, and cont
 
 import textwrap
 
-from ..introspection import COLUMN_TYPES, CONTEXT_TYPES, ENDPOINT_TYPES
+from .. import introspection
 
 
 def generate_model(
@@ -45,8 +45,9 @@ def generate_model(
         col_type = col["type"]
         col_opts = col.get("options", {})
 
-        if col_type not in COLUMN_TYPES:
-            return f"Error: Unknown column type '{col_type}'. Available: {', '.join(sorted(COLUMN_TYPES))}"
+        if col_type not in introspection.COLUMN_TYPES:
+            available = ", ".join(sorted(introspection.COLUMN_TYPES))
+            return f"Error: Unknown column type '{col_type}'. Available: {available}"
 
         # Handle validators in options
         if "validators" in col_opts:
@@ -199,8 +200,8 @@ def generate_endpoint(
     """
     extra_options = extra_options or {}
 
-    if endpoint_type not in ENDPOINT_TYPES:
-        available = ", ".join(sorted(ENDPOINT_TYPES))
+    if endpoint_type not in introspection.ENDPOINT_TYPES:
+        available = ", ".join(sorted(introspection.ENDPOINT_TYPES))
         return f"Error: Unknown endpoint type '{endpoint_type}'. Available: {available}"
 
     parts = []
@@ -252,8 +253,8 @@ def generate_context(
         modules: List of module names to register with DI.
         bindings: Dictionary of name → value DI bindings.
     """
-    if context_type not in CONTEXT_TYPES:
-        available = ", ".join(sorted(CONTEXT_TYPES))
+    if context_type not in introspection.CONTEXT_TYPES:
+        available = ", ".join(sorted(introspection.CONTEXT_TYPES))
         return f"Error: Unknown context type '{context_type}'. Available: {available}"
 
     parts = [f"clearskies.contexts.{context_type}("]
@@ -325,8 +326,9 @@ def generate_endpoint_group(
             ep_url = ep.get("url", "")
             model_name = ep.get("model_name", "")
 
-            if ep_type not in ENDPOINT_TYPES:
-                return f"Error: Unknown endpoint type '{ep_type}'. Available: {', '.join(sorted(ENDPOINT_TYPES))}"
+            if ep_type not in introspection.ENDPOINT_TYPES:
+                available = ", ".join(sorted(introspection.ENDPOINT_TYPES))
+                return f"Error: Unknown endpoint type '{ep_type}'. Available: {available}"
 
             ep_parts = [f"        clearskies.endpoints.{ep_type}("]
 
@@ -0,0 +1,87 @@
+"""Tests for the concepts package."""
+
+from __future__ import annotations
+
+import textwrap
+import unittest
+
+from clearskies_mcp_server.concepts import CONCEPT_EXPLANATIONS, CONCEPT_NAMES
+from clearskies_mcp_server.concepts.internals import INTERNALS_CONCEPTS
+from clearskies_mcp_server.concepts.lifecycle import LIFECYCLE_CONCEPTS
+from clearskies_mcp_server.concepts.observability import OBSERVABILITY_CONCEPTS
+from clearskies_mcp_server.concepts.programming import PROGRAMMING_CONCEPTS
+from clearskies_mcp_server.concepts.reference import REFERENCE_CONCEPTS
+from clearskies_mcp_server.tools.documentation import get_concept_section
+
+# Categories whose explanations are written flush-left in source instead of
+# being passed through textwrap.dedent at import time.
+FLUSH_LEFT_CATEGORIES = {
+    "internals": INTERNALS_CONCEPTS,
+    "lifecycle": LIFECYCLE_CONCEPTS,
+    "observability": OBSERVABILITY_CONCEPTS,
+    "programming": PROGRAMMING_CONCEPTS,
+    "reference": REFERENCE_CONCEPTS,
+}
+
+
+class TestFlushLeftConcepts(unittest.TestCase):
+    """Test concept explanations that are stored pre-dedented."""
+
+    def test_explanations_are_already_dedented(self) -> None:
+        """Test that dedenting a flush-left explanation is a no-op."""
+        for category, concepts in FLUSH_LEFT_CATEGORIES.items():
+            for name, text in concepts.items():
+                with self.subTest(category=category, concept=name):
+                    assert textwrap.dedent(text) == text
+                    assert text.startswith("# ")
+                    assert text.endswith("\n")
+
+    def test_explanations_are_in_combined_mapping(self) -> None:
+        """Test that every flush-left explanation is served by CONCEPT_EXPLANATIONS."""
+        for concepts in FLUSH_LEFT_CATEGORIES.values():
+            for name, text in concepts.items():
+                assert CONCEPT_EXPLANATIONS[name] is text
+
+
+class TestConceptExplanations(unittest.TestCase):
+    """Test the combined concept mapping."""
+
+    def test_mapping_is_read_only(self) -> None:
+        """Test that the combined mapping cannot be modified at runtime."""
+        with self.assertRaises(TypeError):
+            CONCEPT_EXPLANATIONS["model"] = "changed"  # type: ignore[index]
+
+    def test_concept_names_are_sorted_keys(self) -> None:
+        """Test that CONCEPT_NAMES lists every concept in sorted order."""
+        assert CONCEPT_NAMES == tuple(sorted(CONCEPT_EXPLANATIONS))
+
+
+class TestGetConceptSection(unittest.TestCase):
+    """Test retrieving a single section of a concept explanation."""
+
+    def test_returns_subsection(self) -> None:
+        """Test that a ### section stops at the next heading of the same level."""
+        section = get_concept_section("column_reference", "HasMany")
+
+        assert section.startswith("### HasMany\n")
+        assert "columns.HasMany(" in section
+        assert "### HasOne" not in section
+
+    def test_section_includes_nested_headings(self) -> None:
+        """Test that a ## section includes its ### subsections."""
+        section = get_concept_section("column-reference", "string columns")
+
+        assert section.startswith("## String Columns\n")
+        assert "### Email" in section
+        assert "## Numeric Columns" not in section
+
+    def test_unknown_section_lists_available_headings(self) -> None:
+        """Test that an unknown section reports the headings that exist."""
+        result = get_concept_section("column_reference", "no such section")
+
+        assert result.startswith("Unknown section 'no such section'")
+        assert "HasMany" in result
+
+    def test_unknown_concept(self) -> None:
+        """Test that an unknown concept is reported like explain_concept does."""
+        assert get_concept_section("no_such_concept", "anything").startswith("Unknown concept 'no_such_concept'")
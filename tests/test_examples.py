@@ -0,0 +1,92 @@
+"""Tests for the examples package."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+import unittest
+
+from clearskies_mcp_server import examples
+from clearskies_mcp_server.examples import (
+    example_advanced_queries,
+    example_api_backend,
+    example_audit_trail,
+    example_authentication,
+    example_authorization,
+    example_cli_app,
+    example_configuration,
+    example_endpoint_group,
+    example_error_handling,
+    example_hierarchical_data,
+    example_migrations,
+    example_pivot_data,
+    example_relationships,
+    example_restful_api,
+    example_secrets_backend,
+    example_testing,
+)
+
+# Examples whose text is built once at import rather than on every call.
+PRECOMPUTED_EXAMPLES = {
+    "advanced_queries": example_advanced_queries,
+    "api_backend": example_api_backend,
+    "audit_trail": example_audit_trail,
+    "authentication": example_authentication,
+    "authorization": example_authorization,
+    "cli_app": example_cli_app,
+    "configuration": example_configuration,
+    "endpoint_group": example_endpoint_group,
+    "error_handling": example_error_handling,
+    "hierarchical_data": example_hierarchical_data,
+    "migrations": example_migrations,
+    "pivot_data": example_pivot_data,
+    "relationships": example_relationships,
+    "restful_api": example_restful_api,
+    "secrets_backend": example_secrets_backend,
+    "testing": example_testing,
+}
+
+
+class TestPrecomputedExamples(unittest.TestCase):
+    """Test examples that are prepared once at module import."""
+
+    def test_examples_are_dedented(self) -> None:
+        """Test that each example is returned without leading indentation."""
+        for name, example in PRECOMPUTED_EXAMPLES.items():
+            with self.subTest(example=name):
+                text = example()
+                assert textwrap.dedent(text) == text
+                assert text.startswith("# ")
+                assert text.endswith("\n")
+
+    def test_examples_return_the_same_object(self) -> None:
+        """Test that repeated calls return the prepared string instead of rebuilding it."""
+        for name, example in PRECOMPUTED_EXAMPLES.items():
+            with self.subTest(example=name):
+                assert example() is example()
+
+
+class TestLazyExamples(unittest.TestCase):
+    """Test that example submodules are imported on demand."""
+
+    def test_server_import_does_not_load_examples(self) -> None:
+        """Test that starting the server does not import any example submodule."""
+        code = (
+            "import sys, clearskies_mcp_server.server; "
+            "print(sorted(m for m in sys.modules if m.startswith('clearskies_mcp_server.examples.')))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "[]"
+
+    def test_every_example_resolves(self) -> None:
+        """Test that every name in __all__ resolves to an example function."""
+        for name in examples.__all__:
+            with self.subTest(example=name):
+                assert getattr(examples, name)().startswith("#")
+
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown names still raise AttributeError."""
+        with self.assertRaises(AttributeError):
+            getattr(examples, "example_does_not_exist")
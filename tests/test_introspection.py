@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import inspect
+import subprocess
+import sys
 import unittest
 from typing import Any
 from unittest.mock import MagicMock, Mock, patch
@@ -434,5 +436,25 @@ class TestTypeRegistries(unittest.TestCase):
         assert set(introspection.ALL_TYPE_REGISTRIES.keys()) == expected_keys
 
 
+class TestLazyRegistries(unittest.TestCase):
+    """Test that type registries are built on first use."""
+
+    def test_import_does_not_introspect(self) -> None:
+        """Test that importing the module does not import the introspected clearskies modules."""
+        code = "import sys, clearskies_mcp_server.introspection; print('clearskies.validators' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "False"
+
+    def test_module_attribute_matches_registry(self) -> None:
+        """Test that a registry constant is the same object get_type_registry returns."""
+        assert introspection.VALIDATOR_TYPES is introspection.get_type_registry("validators")
+
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown module attributes still raise AttributeError."""
+        with self.assertRaises(AttributeError):
+            getattr(introspection, "UNKNOWN_TYPES")
+
+
 if __name__ == "__main__":
     unittest.main()